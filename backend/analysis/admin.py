@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import SentimentAnalysis, AnalysisComparison, UserPreferences
 
 
@@ -23,6 +24,10 @@ class SentimentAnalysisAdmin(admin.ModelAdmin):
     ]
     date_hierarchy = "created_at"
     list_per_page = 20
+    list_select_related = ["user", "article"]
+    # Searches over article__title/bias_reasoning are unindexed LIKE scans;
+    # skip the second full-table COUNT the changelist runs per search
+    show_full_result_count = False
 
     fieldsets = (
         (
@@ -68,6 +73,22 @@ class SentimentAnalysisAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        # The changelist renders none of the JSON/text blobs, so skip
+        # fetching them; the change form loads deferred fields on demand
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user", "article")
+            .defer(
+                "raw_ai_response",
+                "primary_topics",
+                "topic_distribution",
+                "key_themes",
+                "bias_reasoning",
+            )
+        )
+
     def article_title_short(self, obj):
         return (
             obj.article.title[:50] + "..."
@@ -85,11 +106,21 @@ class AnalysisComparisonAdmin(admin.ModelAdmin):
     search_fields = ["name", "user__username", "comparison_notes"]
     readonly_fields = ["created_at"]
     filter_horizontal = ["analyses"]
+    list_select_related = ["user"]
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(_analyses_count=Count("analyses"))
+        )
 
     def analyses_count(self, obj):
-        return obj.analyses.count()
+        return obj._analyses_count
 
     analyses_count.short_description = "# Analyses"
+    analyses_count.admin_order_field = "_analyses_count"
 
 
 @admin.register(UserPreferences)
@@ -98,6 +129,10 @@ class UserPreferencesAdmin(admin.ModelAdmin):
     list_filter = ["default_analysis_depth", "created_at"]
     search_fields = ["user__username"]
     readonly_fields = ["created_at", "updated_at"]
+    list_select_related = ["user"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("user")
 
     fieldsets = (
         ("User", {"fields": ("user",)}),
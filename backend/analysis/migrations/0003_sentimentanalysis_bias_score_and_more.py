@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-08-27 16:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0002_sentimentanalysis_analysis_se_user_id_6ee9a6_idx'),
+        ('news', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sentimentanalysis',
+            name='bias_score',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(political_bias='far_left', then=models.Value(-1.0)), models.When(political_bias='left', then=models.Value(-0.66)), models.When(political_bias='center_left', then=models.Value(-0.33)), models.When(political_bias='center', then=models.Value(0.0)), models.When(political_bias='neutral', then=models.Value(0.0)), models.When(political_bias='center_right', then=models.Value(0.33)), models.When(political_bias='right', then=models.Value(0.66)), models.When(political_bias='far_right', then=models.Value(1.0)), default=models.Value(0.0), output_field=models.FloatField()), output_field=models.FloatField()),
+        ),
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=models.Index(fields=['bias_score'], name='analysis_se_bias_sc_df5e56_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-08-27 16:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0003_sentimentanalysis_bias_score_and_more'),
+        ('news', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=models.Index(fields=['article', 'analysis_version', '-created_at'], name='analysis_se_article_c50246_idx'),
+        ),
+    ]
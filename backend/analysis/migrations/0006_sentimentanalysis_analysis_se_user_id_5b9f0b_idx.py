@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-08-27 17:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0005_sentimentanalysis_analysis_se_created_198bd8_idx'),
+        ('news', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=models.Index(fields=['user', '-controversy_level'], name='analysis_se_user_id_5b9f0b_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-08-27 17:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0006_sentimentanalysis_analysis_se_user_id_5b9f0b_idx'),
+        ('news', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sentimentanalysis',
+            name='analysis_se_user_id_5b9f0b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=models.Index(condition=models.Q(('controversy_level__gte', 0.6)), fields=['user', '-controversy_level'], name='analysis_controv_hot_idx'),
+        ),
+    ]
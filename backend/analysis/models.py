@@ -3,6 +3,18 @@ from django.contrib.auth.models import User
 from news.models import NewsArticle
 import json
 
+# Numeric bias scale used by bias_score_normalized (-1 = far left, 1 = far right)
+BIAS_SCORE_MAP = {
+    "far_left": -1.0,
+    "left": -0.66,
+    "center_left": -0.33,
+    "center": 0.0,
+    "neutral": 0.0,
+    "center_right": 0.33,
+    "right": 0.66,
+    "far_right": 1.0,
+}
+
 
 class SentimentAnalysis(models.Model):
     """Model to store AI-powered sentiment analysis results"""
@@ -53,6 +65,21 @@ class SentimentAnalysis(models.Model):
         default=dict, help_text="Topic distribution percentages"
     )
 
+    # DB-computed copy of bias_score_normalized so aggregates, filters and
+    # ordering on the numeric bias can run (and be indexed) in SQL
+    bias_score = models.GeneratedField(
+        expression=models.Case(
+            *(
+                models.When(political_bias=bias, then=models.Value(score))
+                for bias, score in BIAS_SCORE_MAP.items()
+            ),
+            default=models.Value(0.0),
+            output_field=models.FloatField(),
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+    )
+
     # Key insights
     key_themes = models.JSONField(default=list, help_text="Main themes identified")
     emotional_tone = models.CharField(max_length=50, blank=True)
@@ -72,6 +99,18 @@ class SentimentAnalysis(models.Model):
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["article", "-created_at"]),
             models.Index(fields=["political_bias"]),
+            models.Index(fields=["user", "article"]),
+            # The controversial feed always filters >= 0.6, so index only
+            # the hot slice (SQLite and Postgres both support partial
+            # indexes via condition)
+            models.Index(
+                fields=["user", "-controversy_level"],
+                condition=models.Q(controversy_level__gte=0.6),
+                name="analysis_controv_hot_idx",
+            ),
+            models.Index(fields=["bias_score"]),
+            models.Index(fields=["article", "analysis_version", "-created_at"]),
+            models.Index(fields=["-created_at"]),
         ]
         verbose_name_plural = "Sentiment Analyses"
 
@@ -81,17 +120,7 @@ class SentimentAnalysis(models.Model):
     @property
     def bias_score_normalized(self):
         """Convert bias to numeric score for visualization (-1 = far left, 1 = far right)"""
-        bias_mapping = {
-            "far_left": -1.0,
-            "left": -0.66,
-            "center_left": -0.33,
-            "center": 0.0,
-            "neutral": 0.0,
-            "center_right": 0.33,
-            "right": 0.66,
-            "far_right": 1.0,
-        }
-        return bias_mapping.get(self.political_bias, 0.0)
+        return BIAS_SCORE_MAP.get(self.political_bias, 0.0)
 
 
 class AnalysisComparison(models.Model):
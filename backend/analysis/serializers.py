@@ -1,7 +1,22 @@
 from rest_framework import serializers
 from .models import SentimentAnalysis, AnalysisComparison, UserPreferences
+from news.models import NewsArticle
 from news.serializers import NewsArticleListSerializer
 
+# Valid NewsAPI categories for user preferences
+_VALID_CATEGORIES = frozenset(
+    {
+        "general",
+        "business",
+        "technology",
+        "politics",
+        "health",
+        "science",
+        "sports",
+        "entertainment",
+    }
+)
+
 
 class SentimentAnalysisSerializer(serializers.ModelSerializer):
     """Serializer for SentimentAnalysis model"""
@@ -53,11 +68,7 @@ class SentimentAnalysisSerializer(serializers.ModelSerializer):
 
     def validate_article_id(self, value):
         """Validate that the article exists"""
-        from news.models import NewsArticle
-
-        try:
-            NewsArticle.objects.get(id=value)
-        except NewsArticle.DoesNotExist:
+        if not NewsArticle.objects.filter(pk=value).exists():
             raise serializers.ValidationError("Article not found")
         return value
 
@@ -86,7 +97,16 @@ class SentimentAnalysisListSerializer(serializers.ModelSerializer):
     article_category = serializers.CharField(
         source="article.category.name", read_only=True
     )
-    bias_score_normalized = serializers.ReadOnlyField()
+    # Read the DB-generated column directly instead of invoking the
+    # bias_score_normalized property per row
+    bias_score_normalized = serializers.FloatField(
+        source="bias_score", read_only=True
+    )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the relations this serializer dereferences per row"""
+        return queryset.select_related("user", "article", "article__category")
 
     class Meta:
         model = SentimentAnalysis
@@ -128,6 +148,11 @@ class AnalysisComparisonSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user_username", "created_at"]
 
     def get_analysis_count(self, obj):
+        # Prefer the annotation set by the viewset queryset; fall back to a
+        # COUNT query for instances serialized outside that path
+        count = getattr(obj, "analysis_count", None)
+        if count is not None:
+            return count
         return obj.analyses.count()
 
     def create(self, validated_data):
@@ -150,14 +175,20 @@ class AnalysisComparisonSerializer(serializers.ModelSerializer):
         if not value:
             raise serializers.ValidationError("At least one analysis is required")
 
+        # Deduplicate while preserving order before hitting the database
+        value = list(dict.fromkeys(value))
+
         user = self.context["request"].user
-        valid_analyses = SentimentAnalysis.objects.filter(
-            id__in=value, user=user
-        ).count()
+        found_ids = set(
+            SentimentAnalysis.objects.filter(id__in=value, user=user).values_list(
+                "id", flat=True
+            )
+        )
 
-        if valid_analyses != len(value):
+        missing = set(value) - found_ids
+        if missing:
             raise serializers.ValidationError(
-                "Some analyses don't exist or don't belong to you"
+                f"Invalid analysis ids: {sorted(missing)}"
             )
 
         return value
@@ -186,22 +217,14 @@ class UserPreferencesSerializer(serializers.ModelSerializer):
         if not isinstance(value, list):
             raise serializers.ValidationError("Preferred categories must be a list")
 
-        valid_categories = [
-            "general",
-            "business",
-            "technology",
-            "politics",
-            "health",
-            "science",
-            "sports",
-            "entertainment",
-        ]
+        if not value:
+            return value
 
-        for category in value:
-            if category not in valid_categories:
-                raise serializers.ValidationError(
-                    f"'{category}' is not a valid category"
-                )
+        invalid = set(value) - _VALID_CATEGORIES
+        if invalid:
+            raise serializers.ValidationError(
+                f"Invalid categories: {sorted(invalid)}"
+            )
 
         return value
 
@@ -221,11 +244,7 @@ class AnalysisRequestSerializer(serializers.Serializer):
 
     def validate_article_id(self, value):
         """Validate that the article exists"""
-        from news.models import NewsArticle
-
-        try:
-            NewsArticle.objects.get(id=value)
-        except NewsArticle.DoesNotExist:
+        if not NewsArticle.objects.filter(pk=value).exists():
             raise serializers.ValidationError("Article not found")
         return value
 
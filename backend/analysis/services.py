@@ -1,88 +1,147 @@
 import json
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+try:
+    import orjson  # Rust JSON parser, ~3-5x faster than the stdlib
+except ImportError:
+    orjson = None
 from openai import OpenAI
 from django.conf import settings
+from django.db.models import Avg, Count, F, Max, Min, QuerySet
 from django.utils import timezone
 from .models import SentimentAnalysis
+from authentication.models import UserProfile
 from news.models import NewsArticle
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared OpenAI client, created lazily on first use so every service
+# instantiation reuses the same connection pool
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Return the process-wide OpenAI client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not settings.OPENAI_API_KEY:
+                    raise ValueError("OPENAI_API_KEY not configured in settings")
+                _client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    return _client
+
+
+def count_topics(queryset):
+    """Tally primary_topics occurrences for a SentimentAnalysis queryset
+
+    primary_topics is a JSONField, so the counting happens in Python; the
+    query fetches just that column and streams it in chunks.
+    """
+    topic_counts = Counter()
+    for topics in queryset.values_list("primary_topics", flat=True).iterator(
+        chunk_size=500
+    ):
+        topic_counts.update(topics or [])
+    return topic_counts
+
+
+def _parse_json(raw):
+    """Parse a JSON document, using orjson when it is installed
+
+    Both parsers raise a ValueError subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Static portion of the analysis prompt, built once at import time; only the
+# article header varies per call
+_PROMPT_STATIC_TAIL = """
+Provide a comprehensive analysis in the following JSON format:
+
+{
+    "political_bias": {
+        "classification": "far_left|left|center_left|center|center_right|right|far_right|neutral",
+        "confidence_score": 0.85,
+        "reasoning": "Detailed explanation of why this classification was chosen"
+    },
+    "sentiment_analysis": {
+        "positive_sentiment": 0.25,
+        "negative_sentiment": 0.15,
+        "neutral_sentiment": 0.60,
+        "overall_sentiment_score": 0.10,
+        "emotional_tone": "cautious|optimistic|pessimistic|angry|neutral|concerned"
+    },
+    "topic_analysis": {
+        "primary_topics": ["economy", "healthcare", "foreign_policy", "immigration", "climate"],
+        "topic_distribution": {
+            "economy": 0.40,
+            "healthcare": 0.30,
+            "immigration": 0.20,
+            "foreign_policy": 0.10
+        }
+    },
+    "key_insights": {
+        "main_themes": ["economic recovery", "policy implications", "public reaction"],
+        "controversy_level": 0.65,
+        "key_phrases": ["significant development", "policy change", "public concern"],
+        "target_audience": "general_public|political_insiders|industry_experts|activists"
+    },
+    "detailed_analysis": {
+        "bias_indicators": ["word choice", "source selection", "framing"],
+        "factual_vs_opinion": {
+            "factual_content": 0.70,
+            "opinion_content": 0.30
+        },
+        "rhetorical_devices": ["statistics", "expert quotes", "emotional appeals"],
+        "missing_perspectives": ["opposition viewpoint", "expert analysis"]
+    }
+}
+
+Rules:
+1. Be objective and analytical
+2. All numeric values should be between 0 and 1
+3. Sentiment percentages should sum to 1.0
+4. Classification must be one of the specified options
+5. Provide specific evidence for bias classification
+6. Focus on political and social implications
+"""
+
 
 class OpenAIAnalysisService:
     """Service for AI-powered sentiment and political analysis using OpenAI"""
 
+    # How long another user's analysis of the same article can be reused
+    # instead of paying for a fresh OpenAI call
+    REUSE_MAX_AGE = timedelta(hours=24)
+
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY not configured in settings")
+        self.client = _get_client()
 
     def get_analysis_prompt(
         self, article_title, article_description, article_content=None
     ):
         """Create comprehensive analysis prompt for OpenAI"""
 
-        content_text = article_content or article_description
-
-        prompt = f"""
-        Please analyze the following news article for political bias, sentiment, and topical content:
-
-        Title: {article_title}
-        Description: {article_description}
-        Content: {content_text[:3000]}  # Limit content length
-
-        Provide a comprehensive analysis in the following JSON format:
-
-        {{
-            "political_bias": {{
-                "classification": "far_left|left|center_left|center|center_right|right|far_right|neutral",
-                "confidence_score": 0.85,
-                "reasoning": "Detailed explanation of why this classification was chosen"
-            }},
-            "sentiment_analysis": {{
-                "positive_sentiment": 0.25,
-                "negative_sentiment": 0.15,
-                "neutral_sentiment": 0.60,
-                "overall_sentiment_score": 0.10,
-                "emotional_tone": "cautious|optimistic|pessimistic|angry|neutral|concerned"
-            }},
-            "topic_analysis": {{
-                "primary_topics": ["economy", "healthcare", "foreign_policy", "immigration", "climate"],
-                "topic_distribution": {{
-                    "economy": 0.40,
-                    "healthcare": 0.30,
-                    "immigration": 0.20,
-                    "foreign_policy": 0.10
-                }}
-            }},
-            "key_insights": {{
-                "main_themes": ["economic recovery", "policy implications", "public reaction"],
-                "controversy_level": 0.65,
-                "key_phrases": ["significant development", "policy change", "public concern"],
-                "target_audience": "general_public|political_insiders|industry_experts|activists"
-            }},
-            "detailed_analysis": {{
-                "bias_indicators": ["word choice", "source selection", "framing"],
-                "factual_vs_opinion": {{
-                    "factual_content": 0.70,
-                    "opinion_content": 0.30
-                }},
-                "rhetorical_devices": ["statistics", "expert quotes", "emotional appeals"],
-                "missing_perspectives": ["opposition viewpoint", "expert analysis"]
-            }}
-        }}
-
-        Rules:
-        1. Be objective and analytical
-        2. All numeric values should be between 0 and 1
-        3. Sentiment percentages should sum to 1.0
-        4. Classification must be one of the specified options
-        5. Provide specific evidence for bias classification
-        6. Focus on political and social implications
-        """
+        # Limit content length
+        content_text = (article_content or article_description)[:3000]
 
-        return prompt
+        return (
+            "Please analyze the following news article for political bias, "
+            "sentiment, and topical content:\n\n"
+            f"Title: {article_title}\n"
+            f"Description: {article_description}\n"
+            f"Content: {content_text}\n"
+            + _PROMPT_STATIC_TAIL
+        )
 
     def analyze_article(self, article, user):
         """
@@ -95,6 +154,68 @@ class OpenAIAnalysisService:
         Returns:
             SentimentAnalysis: Created analysis object
         """
+        analysis = self._clone_recent_analysis(article, user)
+        if analysis is None:
+            analysis = self._build_analysis(article, user)
+        analysis.save()
+
+        self._record_analyses_created(user, 1)
+
+        logger.info(
+            f"Created analysis for article '{article.title[:50]}' by user {user.username}"
+        )
+        return analysis
+
+    def _clone_recent_analysis(self, article, user):
+        """
+        Reuse a recent analysis of the same article from another user
+
+        The OpenAI result depends only on the article content, so a fresh
+        call for an article analyzed moments ago by someone else wastes
+        seconds of latency and API spend. Returns an unsaved copy for the
+        requesting user, or None when no fresh analysis exists.
+        """
+        source = (
+            SentimentAnalysis.objects.filter(
+                article=article,
+                analysis_version=SentimentAnalysis._meta.get_field(
+                    "analysis_version"
+                ).default,
+                created_at__gte=timezone.now() - self.REUSE_MAX_AGE,
+            )
+            .order_by("-created_at")
+            .first()
+        )
+
+        if source is None:
+            return None
+
+        return SentimentAnalysis(
+            user=user,
+            article=article,
+            political_bias=source.political_bias,
+            bias_confidence_score=source.bias_confidence_score,
+            bias_reasoning=source.bias_reasoning,
+            positive_sentiment=source.positive_sentiment,
+            negative_sentiment=source.negative_sentiment,
+            neutral_sentiment=source.neutral_sentiment,
+            overall_sentiment_score=source.overall_sentiment_score,
+            primary_topics=source.primary_topics,
+            topic_distribution=source.topic_distribution,
+            key_themes=source.key_themes,
+            emotional_tone=source.emotional_tone,
+            controversy_level=source.controversy_level,
+            analysis_version=source.analysis_version,
+            raw_ai_response=source.raw_ai_response,
+        )
+
+    def _build_analysis(self, article, user):
+        """
+        Run the OpenAI analysis and return an unsaved SentimentAnalysis
+
+        Kept separate from analyze_article so the bulk path can collect
+        instances and persist them with a single bulk_create.
+        """
         start_time = time.time()
 
         try:
@@ -120,11 +241,16 @@ class OpenAIAnalysisService:
                 response_format={"type": "json_object"},
                 reasoning_effort="low",  # Balance quality and latency
                 verbosity="low",  # Keep responses concise
+                stream=True,  # Consume tokens as they arrive instead of waiting for the full body
             )
 
-            # Parse response
-            raw_response = response.choices[0].message.content
-            analysis_data = json.loads(raw_response)
+            # Accumulate the streamed completion, then parse once
+            parts = []
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+            raw_response = "".join(parts)
+            analysis_data = _parse_json(raw_response)
 
             # Extract data with fallbacks
             political_bias_data = analysis_data.get("political_bias", {})
@@ -135,8 +261,8 @@ class OpenAIAnalysisService:
             # Calculate processing time
             processing_time = time.time() - start_time
 
-            # Create SentimentAnalysis object
-            analysis = SentimentAnalysis.objects.create(
+            # Build the SentimentAnalysis object (caller persists it)
+            return SentimentAnalysis(
                 user=user,
                 article=article,
                 # Political bias
@@ -162,26 +288,21 @@ class OpenAIAnalysisService:
                 raw_ai_response=analysis_data,
             )
 
-            # Update user profile analysis count
-            if hasattr(user, "profile"):
-                profile = user.profile
-                profile.total_analyses_created += 1
-                profile.last_analysis_date = timezone.now()
-                profile.save()
-
-            logger.info(
-                f"Created analysis for article '{article.title[:50]}' by user {user.username}"
-            )
-            return analysis
-
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {e}")
             raise ValueError("Invalid JSON response from AI service")
         except Exception as e:
             logger.error(f"Error during analysis: {e}")
             raise
 
-    def bulk_analyze_articles(self, articles, user, max_articles=10):
+    def _record_analyses_created(self, user, count):
+        """Bump the user's profile counters with a single atomic UPDATE"""
+        UserProfile.objects.filter(user=user).update(
+            total_analyses_created=F("total_analyses_created") + count,
+            last_analysis_date=timezone.now(),
+        )
+
+    def bulk_analyze_articles(self, articles, user, max_articles=10, concurrency=5):
         """
         Analyze multiple articles in batch
 
@@ -189,33 +310,59 @@ class OpenAIAnalysisService:
             articles (QuerySet): Articles to analyze
             user (User): User requesting the analysis
             max_articles (int): Maximum number of articles to analyze
+            concurrency (int): Maximum number of simultaneous OpenAI calls
 
         Returns:
             list: Created SentimentAnalysis objects
         """
         analyses = []
-        processed = 0
-
-        for article in articles[:max_articles]:
-            try:
-                # Skip if already analyzed by this user
-                if SentimentAnalysis.objects.filter(
-                    user=user, article=article
-                ).exists():
-                    continue
 
-                analysis = self.analyze_article(article, user)
-                analyses.append(analysis)
-                processed += 1
+        articles = list(articles[:max_articles])
 
-                # Add delay to respect rate limits
-                time.sleep(1)
+        # Load the already-analyzed article ids in one query so the loop
+        # below is a pure in-memory membership check
+        already_analyzed = set(
+            SentimentAnalysis.objects.filter(
+                user=user, article_id__in=[article.id for article in articles]
+            ).values_list("article_id", flat=True)
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to analyze article {article.id}: {e}")
+        to_analyze = []
+        for article in articles:
+            if article.id in already_analyzed:
                 continue
-
-        logger.info(f"Bulk analyzed {processed} articles for user {user.username}")
+            # Reuse fresh analyses of the same article before paying for
+            # new OpenAI calls
+            clone = self._clone_recent_analysis(article, user)
+            if clone is not None:
+                analyses.append(clone)
+            else:
+                to_analyze.append(article)
+
+        # Each analysis spends seconds waiting on the OpenAI API, so run the
+        # calls concurrently; the OpenAI client retries on rate limits
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self._build_analysis, article, user): article
+                for article in to_analyze
+            }
+
+            for future in as_completed(futures):
+                article = futures[future]
+                try:
+                    analyses.append(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to analyze article {article.id}: {e}")
+
+        # Persist the whole batch in one INSERT and bump the profile
+        # counters with a single atomic UPDATE
+        SentimentAnalysis.objects.bulk_create(analyses, batch_size=100)
+        if analyses:
+            self._record_analyses_created(user, len(analyses))
+
+        logger.info(
+            f"Bulk analyzed {len(analyses)} articles for user {user.username}"
+        )
         return analyses
 
     def get_comparative_analysis(self, analyses):
@@ -228,59 +375,82 @@ class OpenAIAnalysisService:
         Returns:
             dict: Comparative analysis results
         """
+        # For querysets, let the database compute the aggregates instead of
+        # transferring every row to Python
+        if isinstance(analyses, QuerySet):
+            return self._get_comparative_analysis_from_db(analyses)
+
+        # Materialize once so the iterable isn't re-evaluated per traversal
+        analyses = list(analyses)
         if not analyses:
             return {}
 
-        # Calculate averages and distributions
-        bias_scores = [analysis.bias_score_normalized for analysis in analyses]
-        sentiment_scores = [analysis.overall_sentiment_score for analysis in analyses]
-        controversy_levels = [analysis.controversy_level for analysis in analyses]
+        # Single pass: collect scores and distributions together
+        bias_scores = []
+        sentiment_scores = []
+        controversy_levels = []
+        bias_distribution = Counter()
+        topic_counts = Counter()
 
-        # Count bias classifications
-        bias_distribution = {}
         for analysis in analyses:
-            bias = analysis.political_bias
-            bias_distribution[bias] = bias_distribution.get(bias, 0) + 1
+            bias_scores.append(analysis.bias_score_normalized)
+            sentiment_scores.append(analysis.overall_sentiment_score)
+            controversy_levels.append(analysis.controversy_level)
+            bias_distribution[analysis.political_bias] += 1
+            topic_counts.update(analysis.primary_topics)
 
-        # Collect all topics
-        all_topics = []
-        for analysis in analyses:
-            all_topics.extend(analysis.primary_topics)
+        total = len(analyses)
+
+        return {
+            "total_articles": total,
+            "average_bias_score": sum(bias_scores) / total,
+            "average_sentiment": sum(sentiment_scores) / total,
+            "average_controversy": sum(controversy_levels) / total,
+            "bias_distribution": dict(bias_distribution),
+            "top_topics": topic_counts.most_common(10),
+            "sentiment_range": {
+                "min": min(sentiment_scores),
+                "max": max(sentiment_scores),
+            },
+        }
 
-        # Count topic frequencies
-        topic_counts = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+    def _get_comparative_analysis_from_db(self, queryset):
+        """Compute comparative stats with database aggregates"""
+        stats = queryset.aggregate(
+            total=Count("id"),
+            average_bias_score=Avg("bias_score"),
+            average_sentiment=Avg("overall_sentiment_score"),
+            average_controversy=Avg("controversy_level"),
+            min_sentiment=Min("overall_sentiment_score"),
+            max_sentiment=Max("overall_sentiment_score"),
+        )
+
+        if not stats["total"]:
+            return {}
+
+        bias_distribution = {
+            row["political_bias"]: row["count"]
+            for row in queryset.values("political_bias").annotate(count=Count("id"))
+        }
+
+        topic_counts = count_topics(queryset)
 
         return {
-            "total_articles": len(analyses),
-            "average_bias_score": (
-                sum(bias_scores) / len(bias_scores) if bias_scores else 0
-            ),
-            "average_sentiment": (
-                sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-            ),
-            "average_controversy": (
-                sum(controversy_levels) / len(controversy_levels)
-                if controversy_levels
-                else 0
-            ),
+            "total_articles": stats["total"],
+            "average_bias_score": stats["average_bias_score"] or 0,
+            "average_sentiment": stats["average_sentiment"] or 0,
+            "average_controversy": stats["average_controversy"] or 0,
             "bias_distribution": bias_distribution,
-            "top_topics": sorted(
-                topic_counts.items(), key=lambda x: x[1], reverse=True
-            )[:10],
+            "top_topics": topic_counts.most_common(10),
             "sentiment_range": {
-                "min": min(sentiment_scores) if sentiment_scores else 0,
-                "max": max(sentiment_scores) if sentiment_scores else 0,
+                "min": stats["min_sentiment"] or 0,
+                "max": stats["max_sentiment"] or 0,
             },
         }
 
 
 def get_trending_topics(user=None, days=7):
     """Get trending topics from recent analyses"""
-    from django.utils import timezone
-    from datetime import timedelta
-
     since_date = timezone.now() - timedelta(days=days)
 
     # Get recent analyses
@@ -288,14 +458,4 @@ def get_trending_topics(user=None, days=7):
     if user:
         analyses_query = analyses_query.filter(user=user)
 
-    # Collect all topics
-    all_topics = []
-    for analysis in analyses_query:
-        all_topics.extend(analysis.primary_topics)
-
-    # Count and sort topics
-    topic_counts = {}
-    for topic in all_topics:
-        topic_counts[topic] = topic_counts.get(topic, 0) + 1
-
-    return sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
+    return count_topics(analyses_query).most_common()
@@ -1,9 +1,14 @@
+import hashlib
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import Count, Avg, Q
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Count, Avg, Max, Min, Prefetch, Q
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta, datetime
 from .models import SentimentAnalysis, AnalysisComparison, UserPreferences
 from .serializers import (
@@ -15,35 +20,120 @@ from .serializers import (
     AnalysisStatsSerializer,
     TrendingTopicsSerializer,
 )
-from .services import OpenAIAnalysisService, get_trending_topics
+from .services import OpenAIAnalysisService, count_topics, get_trending_topics
 from news.models import NewsArticle
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _ai_service():
+    """Shared OpenAIAnalysisService so requests reuse one HTTP client"""
+    return OpenAIAnalysisService()
+
+
+def _parse_date_param(value):
+    """Parse an ISO date/datetime query param into an aware datetime
+
+    Returns (start, is_date_only); date-only values come back as midnight
+    so callers can build half-open [start, end) ranges that filter on the
+    raw column and stay index-friendly.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None, False
+
+    is_date_only = (
+        parsed.hour == parsed.minute == parsed.second == parsed.microsecond == 0
+        and len(value) <= 10
+    )
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed, is_date_only
+
+
+class _CachedCountPaginator(Paginator):
+    """Paginator that reuses a cached COUNT(*) between page fetches"""
+
+    def __init__(self, *args, count_cache_key=None, refresh=False, timeout=300):
+        super().__init__(*args)
+        self._count_cache_key = count_cache_key
+        self._refresh = refresh
+        self._timeout = timeout
+
+    @cached_property
+    def count(self):
+        if self._count_cache_key and not self._refresh:
+            cached = cache.get(self._count_cache_key)
+            if cached is not None:
+                return cached
+
+        value = Paginator.count.func(self)
+        if self._count_cache_key:
+            cache.set(self._count_cache_key, value, self._timeout)
+        return value
+
+
 class AnalysisPagination(PageNumberPagination):
-    """Pagination for analysis results"""
+    """Pagination for analysis results
+
+    The total count is recomputed on page 1 and cached per (user, filters)
+    for subsequent pages, so deep scrolling doesn't re-run COUNT(*) over
+    the whole history; counts on later pages may lag by up to the TTL.
+    """
 
     page_size = 15
     page_size_query_param = "page_size"
     max_page_size = 50
+    count_cache_timeout = 300
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = sorted(
+            (key, values)
+            for key, values in request.query_params.lists()
+            if key != self.page_query_param
+        )
+        raw_key = f"{type(view).__name__}:{request.user.pk}:{params}"
+        self._count_cache_key = (
+            "analysis-count:" + hashlib.md5(raw_key.encode()).hexdigest()
+        )
+        page_number = request.query_params.get(self.page_query_param) or "1"
+        self._count_refresh = page_number == "1"
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, queryset, page_size):
+        return _CachedCountPaginator(
+            queryset,
+            page_size,
+            count_cache_key=self._count_cache_key,
+            refresh=self._count_refresh,
+            timeout=self.count_cache_timeout,
+        )
 
 
-class SentimentAnalysisViewSet(viewsets.ModelViewSet):
-    """ViewSet for sentiment analysis"""
+class SentimentAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet for sentiment analysis
+
+    Analyses are created through the analyze_article action; the generic
+    write routes were unused, so the viewset is read-only plus actions.
+    """
 
     serializer_class = SentimentAnalysisSerializer
     pagination_class = AnalysisPagination
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
-        """Filter analyses for current user"""
-        queryset = (
-            SentimentAnalysis.objects.filter(user=self.request.user)
-            .select_related("article__source", "article__category")
-            .order_by("-created_at")
-        )
+    def _base_queryset(self):
+        """User's analyses with query-param filters, without joins
+
+        Aggregate-style actions (stats) should build on this so the DB
+        isn't asked to join source/category rows it never returns.
+        """
+        queryset = SentimentAnalysis.objects.filter(
+            user=self.request.user
+        ).order_by("-created_at")
 
         # Filter by political bias
         bias = self.request.query_params.get("bias")
@@ -55,14 +145,24 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
         if category:
             queryset = queryset.filter(article__category__slug=category)
 
-        # Filter by date range
+        # Filter by date range as half-open [start, end) on the raw
+        # column so the (user, created_at) index is usable as a range
+        # scan; a date-only upper bound includes that whole day
         from_date = self.request.query_params.get("from_date")
         to_date = self.request.query_params.get("to_date")
 
         if from_date:
-            queryset = queryset.filter(created_at__gte=from_date)
+            start, _ = _parse_date_param(from_date)
+            if start:
+                queryset = queryset.filter(created_at__gte=start)
         if to_date:
-            queryset = queryset.filter(created_at__lte=to_date)
+            end, is_date_only = _parse_date_param(to_date)
+            if end:
+                if is_date_only:
+                    end += timedelta(days=1)
+                    queryset = queryset.filter(created_at__lt=end)
+                else:
+                    queryset = queryset.filter(created_at__lte=end)
 
         # Filter by controversy level
         min_controversy = self.request.query_params.get("min_controversy")
@@ -75,6 +175,25 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_queryset(self):
+        """Filtered analyses with the joins the serializers dereference"""
+        queryset = self._base_queryset().select_related(
+            "user", "article__source", "article__category"
+        )
+
+        # List-style actions use the lightweight serializer, which never
+        # touches the JSON/text blobs — don't fetch them
+        if self.action in ("list", "recent", "controversial"):
+            queryset = queryset.defer(
+                "raw_ai_response",
+                "primary_topics",
+                "topic_distribution",
+                "key_themes",
+                "bias_reasoning",
+            )
+
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "list":
             return SentimentAnalysisListSerializer
@@ -91,10 +210,15 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
         try:
             article = NewsArticle.objects.get(id=article_id)
 
-            # Check if user already analyzed this article
-            existing_analysis = SentimentAnalysis.objects.filter(
-                user=request.user, article=article
-            ).first()
+            # Check if user already analyzed this article; join the
+            # relations the serializer walks so the early return doesn't
+            # issue per-FK follow-up queries
+            existing_analysis = (
+                SentimentAnalysis.objects.filter(user=request.user, article=article)
+                .select_related("user", "article__source", "article__category")
+                .order_by("-created_at")
+                .first()
+            )
 
             if existing_analysis:
                 return Response(
@@ -104,9 +228,8 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
                     }
                 )
 
-            # Create analysis using OpenAI service
-            ai_service = OpenAIAnalysisService()
-            analysis = ai_service.analyze_article(article, request.user)
+            # Create analysis using the shared OpenAI service
+            analysis = _ai_service().analyze_article(article, request.user)
 
             serializer = SentimentAnalysisSerializer(analysis)
             return Response(
@@ -131,73 +254,96 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def stats(self, request):
         """Get user's analysis statistics"""
-        user_analyses = self.get_queryset()
-
-        if not user_analyses.exists():
-            return Response({"total_analyses": 0, "message": "No analyses found"})
-
-        # Calculate statistics
-        total_analyses = user_analyses.count()
-
-        # Bias distribution
-        bias_distribution = {}
-        for analysis in user_analyses:
-            bias = analysis.political_bias
-            bias_distribution[bias] = bias_distribution.get(bias, 0) + 1
-
-        # Average scores
-        avg_sentiment = (
-            user_analyses.aggregate(avg_sentiment=Avg("overall_sentiment_score"))[
-                "avg_sentiment"
-            ]
-            or 0
+        # Stats only change when the user creates an analysis, which
+        # advances profile.last_analysis_date — bake it into the cache key
+        # so dashboard refreshes are served from cache and new analyses
+        # invalidate implicitly
+        profile = getattr(request.user, "profile", None)
+        stamp = (
+            profile.last_analysis_date.isoformat()
+            if profile and profile.last_analysis_date
+            else "0"
         )
-
-        avg_controversy = (
-            user_analyses.aggregate(avg_controversy=Avg("controversy_level"))[
-                "avg_controversy"
-            ]
-            or 0
+        params = sorted(request.query_params.lists())
+        raw_key = f"{request.user.pk}:{stamp}:{params}"
+        cache_key = "analysis-stats:" + hashlib.md5(raw_key.encode()).hexdigest()
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        user_analyses = self._base_queryset()
+
+        # One aggregate query for every scalar statistic; its total also
+        # covers the empty-history check without a separate exists()
+        aggregates = user_analyses.aggregate(
+            total=Count("id"),
+            avg_bias=Avg("bias_score"),
+            avg_sentiment=Avg("overall_sentiment_score"),
+            avg_controversy=Avg("controversy_level"),
+            min_sentiment=Min("overall_sentiment_score"),
+            max_sentiment=Max("overall_sentiment_score"),
         )
 
-        avg_bias = (
-            sum(analysis.bias_score_normalized for analysis in user_analyses)
-            / total_analyses
-        )
+        total_analyses = aggregates["total"]
+        if total_analyses == 0:
+            empty = {"total_analyses": 0, "message": "No analyses found"}
+            cache.set(cache_key, empty, 3600)
+            return Response(empty)
+
+        avg_bias = aggregates["avg_bias"] or 0
+        avg_sentiment = aggregates["avg_sentiment"] or 0
+        avg_controversy = aggregates["avg_controversy"] or 0
+
+        # Bias distribution via a single GROUP BY; clear the queryset's
+        # -created_at ordering first or it joins the GROUP BY and splits
+        # every analysis into its own group
+        bias_distribution = {
+            row["political_bias"]: row["count"]
+            for row in user_analyses.order_by()
+            .values("political_bias")
+            .annotate(count=Count("id"))
+        }
 
         # Top topics
-        all_topics = []
-        for analysis in user_analyses:
-            all_topics.extend(analysis.primary_topics)
-
-        topic_counts = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-
-        top_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_topics = count_topics(user_analyses).most_common(10)
 
         # Sentiment range
-        sentiment_scores = [a.overall_sentiment_score for a in user_analyses]
         sentiment_range = {
-            "min": min(sentiment_scores) if sentiment_scores else 0,
-            "max": max(sentiment_scores) if sentiment_scores else 0,
+            "min": aggregates["min_sentiment"] or 0,
+            "max": aggregates["max_sentiment"] or 0,
         }
 
-        # Analyses by month (last 12 months)
-        analyses_by_month = []
+        # Analyses by month (last 12 calendar months) via one GROUP BY
         now = timezone.now()
-        for i in range(12):
-            month_start = now.replace(day=1) - timedelta(days=30 * i)
-            month_end = month_start.replace(day=28) + timedelta(
-                days=4
-            )  # Approximate month end
+        start_year, start_month = now.year, now.month - 11
+        if start_month < 1:
+            start_month += 12
+            start_year -= 1
+        window_start = now.replace(
+            year=start_year, month=start_month, day=1,
+            hour=0, minute=0, second=0, microsecond=0,
+        )
 
-            count = user_analyses.filter(
-                created_at__gte=month_start, created_at__lt=month_end
-            ).count()
+        # order_by() again: the inherited -created_at ordering would slip
+        # into the GROUP BY and cap every month at 1
+        monthly_counts = {
+            row["month"].strftime("%Y-%m"): row["count"]
+            for row in user_analyses.filter(created_at__gte=window_start)
+            .order_by()
+            .annotate(month=TruncMonth("created_at"))
+            .values("month")
+            .annotate(count=Count("id"))
+        }
 
+        analyses_by_month = []
+        for i in range(12):
+            month = start_month + i
+            year = start_year + (month - 1) // 12
+            month = (month - 1) % 12 + 1
+            label = f"{year:04d}-{month:02d}"
             analyses_by_month.append(
-                {"month": month_start.strftime("%Y-%m"), "count": count}
+                {"month": label, "count": monthly_counts.get(label, 0)}
             )
 
         stats_data = {
@@ -208,16 +354,20 @@ class SentimentAnalysisViewSet(viewsets.ModelViewSet):
             "bias_distribution": bias_distribution,
             "top_topics": top_topics,
             "sentiment_range": sentiment_range,
-            "analyses_by_month": list(reversed(analyses_by_month)),
+            "analyses_by_month": analyses_by_month,
         }
 
         serializer = AnalysisStatsSerializer(stats_data)
+        cache.set(cache_key, serializer.data, 3600)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def trending_topics(self, request):
         """Get trending topics from user's analyses"""
-        days = int(request.query_params.get("days", 7))
+        try:
+            days = int(request.query_params.get("days", 7))
+        except ValueError:
+            days = 7
         topics = get_trending_topics(user=request.user, days=days)
 
         total_count = sum(count for _, count in topics)
@@ -260,9 +410,24 @@ class AnalysisComparisonViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return AnalysisComparison.objects.filter(
-            user=self.request.user
-        ).prefetch_related("analyses")
+        # The nested list serializer walks article/category on each
+        # analysis, so join them in the prefetch query
+        return (
+            AnalysisComparison.objects.filter(user=self.request.user)
+            .select_related("user")
+            .prefetch_related(
+                Prefetch(
+                    "analyses",
+                    queryset=SentimentAnalysis.objects.select_related(
+                        "article__source", "article__category"
+                    ),
+                )
+            )
+            .annotate(analysis_count=Count("analyses"))
+            # Aggregate annotations drop Meta.ordering; restate it so
+            # pagination stays stable
+            .order_by("-created_at")
+        )
 
     @action(detail=True, methods=["get"])
     def comparative_stats(self, request, pk=None):
@@ -273,11 +438,8 @@ class AnalysisComparisonViewSet(viewsets.ModelViewSet):
         if not analyses:
             return Response({"error": "No analyses in comparison"})
 
-        # Use the service to get comparative analysis
-        from .services import OpenAIAnalysisService
-
-        service = OpenAIAnalysisService()
-        stats = service.get_comparative_analysis(analyses)
+        # Use the shared service to get comparative analysis
+        stats = _ai_service().get_comparative_analysis(analyses)
 
         return Response(stats)
 
@@ -293,25 +455,19 @@ class UserPreferencesViewSet(viewsets.ModelViewSet):
 
     def get_object(self):
         """Get or create user preferences"""
-        try:
-            return self.get_queryset().get()
-        except UserPreferences.DoesNotExist:
-            return UserPreferences.objects.create(user=self.request.user)
+        preferences, _ = UserPreferences.objects.get_or_create(
+            user=self.request.user
+        )
+        return preferences
 
     def create(self, request):
-        """Override create to handle get_or_create logic"""
-        preferences, created = UserPreferences.objects.get_or_create(
-            user=request.user, defaults=request.data
-        )
+        """Create or update the user's preferences in one upsert"""
+        serializer = self.get_serializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
 
-        if not created:
-            # Update existing preferences
-            serializer = self.get_serializer(
-                preferences, data=request.data, partial=True
-            )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            preferences = serializer.instance
+        preferences, created = UserPreferences.objects.update_or_create(
+            user=request.user, defaults=serializer.validated_data
+        )
 
         serializer = self.get_serializer(preferences)
         return Response(
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import DurationField, ExpressionWrapper, F
 from .models import UserProfile, UserSession
 
 
@@ -58,12 +59,27 @@ class UserSessionAdmin(admin.ModelAdmin):
     search_fields = ["user__username", "ip_address", "session_key"]
     readonly_fields = ["created_at", "last_activity"]
     date_hierarchy = "created_at"
+    list_select_related = ["user"]
+
+    def get_queryset(self, request):
+        # Annotating the duration lets the changelist sort on it in SQL
+        # instead of recomputing per row in Python
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(
+                _duration=ExpressionWrapper(
+                    F("last_activity") - F("created_at"),
+                    output_field=DurationField(),
+                )
+            )
+        )
 
     def session_duration(self, obj):
-        if obj.last_activity and obj.created_at:
-            duration = obj.last_activity - obj.created_at
-            minutes = int(duration.total_seconds() / 60)
-            return f"{minutes} minutes"
+        if obj._duration is not None:
+            return f"{int(obj._duration.total_seconds() / 60)} minutes"
         return "N/A"
 
     session_duration.short_description = "Duration"
+    session_duration.admin_order_field = "_duration"
@@ -60,10 +60,3 @@ def create_user_profile(sender, instance, created, **kwargs):
     """Automatically create UserProfile when User is created"""
     if created:
         UserProfile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save UserProfile when User is saved"""
-    if hasattr(instance, "profile"):
-        instance.profile.save()
@@ -78,10 +78,15 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     username = serializers.CharField(source="user.username", read_only=True)
     email = serializers.EmailField(source="user.email", read_only=True)
-    full_name = serializers.CharField(read_only=True)
+    full_name = serializers.SerializerMethodField()
     first_name = serializers.CharField(source="user.first_name")
     last_name = serializers.CharField(source="user.last_name")
 
+    def get_full_name(self, obj):
+        """Build the full name from the already-joined user row"""
+        user = obj.user
+        return f"{user.first_name} {user.last_name}".strip() or user.username
+
     class Meta:
         model = UserProfile
         fields = [
@@ -151,8 +156,11 @@ class UserSessionSerializer(serializers.ModelSerializer):
 
     def get_duration_minutes(self, obj):
         """Calculate session duration in minutes"""
-        if obj.last_activity and obj.created_at:
+        # Prefer the _duration annotation from the viewset queryset
+        duration = getattr(obj, "_duration", None)
+        if duration is None and obj.last_activity and obj.created_at:
             duration = obj.last_activity - obj.created_at
+        if duration is not None:
             return int(duration.total_seconds() / 60)
         return 0
 
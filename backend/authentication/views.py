@@ -3,7 +3,8 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from django.contrib.auth import login, logout
 from django.contrib.auth.models import User
-from django.db.models import Count
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from datetime import timedelta
 from .models import UserProfile, UserSession
@@ -21,6 +22,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _user_analyses(user):
+    """Base queryset for a user's analyses, shared by stats and dashboard"""
+    from analysis.models import SentimentAnalysis
+
+    return SentimentAnalysis.objects.filter(user=user)
+
+
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
 def register_view(request):
@@ -63,10 +71,11 @@ def login_view(request):
         # Log the user in
         login(request, user)
 
-        # Create or update session record
+        # Create or update session record in one upsert; last_activity
+        # is auto_now, so the update touches it without loading the row
         session_key = request.session.session_key
         if session_key:
-            session, created = UserSession.objects.get_or_create(
+            UserSession.objects.update_or_create(
                 user=user,
                 session_key=session_key,
                 defaults={
@@ -76,11 +85,6 @@ def login_view(request):
                 },
             )
 
-            if not created:
-                session.last_activity = timezone.now()
-                session.is_active = True
-                session.save()
-
         return Response(
             {"message": "Login successful", "user": UserSerializer(user).data}
         )
@@ -118,15 +122,20 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return UserProfile.objects.filter(user=self.request.user)
+        # The serializer reads username/email/first_name/last_name off the
+        # related user, so join it up front
+        return UserProfile.objects.filter(user=self.request.user).select_related(
+            "user"
+        )
 
     def get_object(self):
         """Get or create user profile"""
-        try:
-            return self.get_queryset().get()
-        except UserProfile.DoesNotExist:
-            # This should not happen due to signals, but just in case
-            return UserProfile.objects.create(user=self.request.user)
+        # The signal normally creates the profile; get_or_create covers
+        # legacy users atomically instead of a get/except/create race
+        profile, _ = UserProfile.objects.select_related("user").get_or_create(
+            user=self.request.user
+        )
+        return profile
 
     def list(self, request):
         """Return current user's profile"""
@@ -146,74 +155,63 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     def stats(self, request):
         """Get user statistics"""
         user = request.user
-        profile = self.get_object()
 
         # Get analysis statistics
-        from analysis.models import SentimentAnalysis
-
-        analyses = SentimentAnalysis.objects.filter(user=user)
+        from analysis.services import count_topics
 
-        total_analyses = analyses.count()
+        analyses = _user_analyses(user)
+        now = timezone.now()
 
-        # Analyses this month
-        month_start = timezone.now().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
+        # Totals, this-month count and average bias in one aggregate
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        aggregates = analyses.aggregate(
+            total=Count("id"),
+            this_month=Count("id", filter=Q(created_at__gte=month_start)),
+            avg_bias=Avg("bias_score"),
         )
-        analyses_this_month = analyses.filter(created_at__gte=month_start).count()
-
-        # Favorite categories (most analyzed)
-        category_counts = {}
-        for analysis in analyses.select_related("article__category"):
-            if analysis.article.category:
-                cat_name = analysis.article.category.name
-                category_counts[cat_name] = category_counts.get(cat_name, 0) + 1
-
-        favorite_categories = sorted(
-            category_counts.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-
-        # Average sentiment bias
-        if total_analyses > 0:
-            avg_bias = (
-                sum(analysis.bias_score_normalized for analysis in analyses)
-                / total_analyses
-            )
-        else:
-            avg_bias = 0
 
-        # Most controversial topics
-        all_topics = []
-        controversial_analyses = analyses.filter(controversy_level__gte=0.7)
-        for analysis in controversial_analyses:
-            all_topics.extend(analysis.primary_topics)
+        # Favorite categories (most analyzed) via a single GROUP BY
+        favorite_categories = [
+            {"name": row["article__category__name"], "count": row["count"]}
+            for row in analyses.exclude(article__category__isnull=True)
+            .values("article__category__name")
+            .annotate(count=Count("id"))
+            .order_by("-count")[:5]
+        ]
 
-        topic_counts = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        # Most controversial topics
+        controversial_topics = count_topics(
+            analyses.filter(controversy_level__gte=0.7)
+        ).most_common(5)
 
-        controversial_topics = sorted(
-            topic_counts.items(), key=lambda x: x[1], reverse=True
-        )[:5]
+        # Analysis activity (last 30 days) via one GROUP BY, zero-filled
+        window_start = (now - timedelta(days=29)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        daily_counts = {
+            row["day"].isoformat(): row["count"]
+            for row in analyses.filter(created_at__gte=window_start)
+            .annotate(day=TruncDate("created_at"))
+            .values("day")
+            .annotate(count=Count("id"))
+        }
 
-        # Analysis activity (last 30 days)
+        today = now.date()
         activity_data = []
-        for i in range(30):
-            date = timezone.now().date() - timedelta(days=i)
-            count = analyses.filter(created_at__date=date).count()
-            activity_data.append({"date": date.isoformat(), "count": count})
+        for i in range(29, -1, -1):
+            date = (today - timedelta(days=i)).isoformat()
+            activity_data.append({"date": date, "count": daily_counts.get(date, 0)})
 
         stats_data = {
-            "total_analyses": total_analyses,
-            "analyses_this_month": analyses_this_month,
-            "favorite_categories": [
-                {"name": name, "count": count} for name, count in favorite_categories
-            ],
-            "average_sentiment_bias": avg_bias,
+            "total_analyses": aggregates["total"],
+            "analyses_this_month": aggregates["this_month"],
+            "favorite_categories": favorite_categories,
+            "average_sentiment_bias": aggregates["avg_bias"] or 0,
             "most_controversial_topics": [
                 {"topic": topic, "count": count}
                 for topic, count in controversial_topics
             ],
-            "analysis_activity": list(reversed(activity_data)),
+            "analysis_activity": activity_data,
         }
 
         serializer = UserStatsSerializer(stats_data)
@@ -240,8 +238,16 @@ class UserSessionViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return UserSession.objects.filter(user=self.request.user).order_by(
-            "-last_activity"
+        return (
+            UserSession.objects.filter(user=self.request.user)
+            .select_related("user")
+            .annotate(
+                _duration=ExpressionWrapper(
+                    F("last_activity") - F("created_at"),
+                    output_field=DurationField(),
+                )
+            )
+            .order_by("-last_activity")
         )
 
     @action(detail=False, methods=["get"])
@@ -254,9 +260,14 @@ class UserSessionViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, methods=["post"])
     def terminate(self, request, pk=None):
         """Terminate a specific session"""
-        session = self.get_object()
-        session.is_active = False
-        session.save()
+        # One UPDATE instead of the get_object SELECT + save round-trip
+        updated = UserSession.objects.filter(
+            user=request.user, pk=pk
+        ).update(is_active=False)
+        if not updated:
+            return Response(
+                {"error": "Session not found"}, status=status.HTTP_404_NOT_FOUND
+            )
 
         return Response({"message": "Session terminated"})
 
@@ -278,10 +289,9 @@ def get_client_ip(request):
     """Get client IP address from request"""
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
     if x_forwarded_for:
-        ip = x_forwarded_for.split(",")[0]
-    else:
-        ip = request.META.get("REMOTE_ADDR")
-    return ip
+        # partition stops at the first comma without building a list
+        return x_forwarded_for.partition(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
 
 
 @api_view(["GET"])
@@ -289,22 +299,25 @@ def get_client_ip(request):
 def dashboard_data(request):
     """Get dashboard data for authenticated user"""
     user = request.user
+    analyses = _user_analyses(user)
 
-    # Get recent analyses
-    from analysis.models import SentimentAnalysis
-
+    # Only the columns the response reads; the (user, -created_at) index
+    # makes the [:5] slice a range scan
     recent_analyses = (
-        SentimentAnalysis.objects.filter(user=user)
-        .select_related("article")
+        analyses.select_related("article")
+        .only(
+            "id",
+            "political_bias",
+            "controversy_level",
+            "created_at",
+            "article__title",
+        )
         .order_by("-created_at")[:5]
     )
 
     # Get analysis count by category
-    from django.db.models import Count
-
     category_stats = (
-        SentimentAnalysis.objects.filter(user=user)
-        .values("article__category__name")
+        analyses.values("article__category__name")
         .annotate(count=Count("id"))
         .order_by("-count")[:5]
     )
@@ -315,6 +328,7 @@ def dashboard_data(request):
     recent_reads = (
         UserReadArticle.objects.filter(user=user)
         .select_related("article")
+        .only("id", "read_at", "article__id", "article__title")
         .order_by("-read_at")[:5]
     )
 
@@ -31,6 +31,9 @@ class NewsArticleAdmin(admin.ModelAdmin):
     readonly_fields = ["created_at", "updated_at"]
     date_hierarchy = "published_at"
     list_per_page = 25
+    # Title/description searches are unindexed LIKE scans; avoid doubling
+    # them with the changelist's full-result COUNT
+    show_full_result_count = False
 
     fieldsets = (
         (
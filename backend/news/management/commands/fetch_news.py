@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from news.services import NewsAPIService
+from news.services import get_news_api_service
 
 
 class Command(BaseCommand):
@@ -30,7 +30,7 @@ class Command(BaseCommand):
             self.stdout.write(f"Category: {category}")
 
         try:
-            service = NewsAPIService()
+            service = get_news_api_service()
             created_count = service.fetch_and_store_articles(
                 category=category, max_articles=max_articles
             )
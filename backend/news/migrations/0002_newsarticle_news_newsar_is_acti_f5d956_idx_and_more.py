@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-08-27 17:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['is_active', '-published_at'], name='news_newsar_is_acti_f5d956_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['category', 'is_active'], name='news_newsar_categor_58410f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userreadarticle',
+            index=models.Index(fields=['user', '-read_at'], name='news_userre_user_id_0d8a95_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-08-27 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_newsarticle_news_newsar_is_acti_f5d956_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_newsar_is_acti_f5d956_idx',
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-published_at'], name='news_active_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-08-27 17:31
+
+from django.db import migrations, models
+
+
+def backfill_counts(apps, schema_editor):
+    from django.db.models import Count, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    for model_name, fk_field in (("NewsSource", "source"), ("NewsCategory", "category")):
+        model = apps.get_model("news", model_name)
+        active = (
+            NewsArticle.objects.filter(**{fk_field: OuterRef("pk")}, is_active=True)
+            .order_by()
+            .values(fk_field)
+            .annotate(c=Count("pk"))
+            .values("c")[:1]
+        )
+        model.objects.update(
+            active_article_count=Coalesce(Subquery(active), Value(0))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_remove_newsarticle_news_newsar_is_acti_f5d956_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newscategory',
+            name='active_article_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='newssource',
+            name='active_article_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
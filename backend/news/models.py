@@ -10,6 +10,10 @@ class NewsSource(models.Model):
     url = models.URLField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Denormalized count of active articles, recomputed after ingestion
+    # so list endpoints don't aggregate over the articles table
+    active_article_count = models.PositiveIntegerField(default=0, db_index=True)
+
     def __str__(self):
         return self.name
 
@@ -21,6 +25,9 @@ class NewsCategory(models.Model):
     slug = models.SlugField(unique=True)
     description = models.TextField(blank=True)
 
+    # Denormalized like NewsSource.active_article_count
+    active_article_count = models.PositiveIntegerField(default=0, db_index=True)
+
     class Meta:
         verbose_name_plural = "News Categories"
 
@@ -61,6 +68,15 @@ class NewsArticle(models.Model):
             models.Index(fields=["-published_at"]),
             models.Index(fields=["category", "-published_at"]),
             models.Index(fields=["source", "-published_at"]),
+            # List endpoints always filter is_active=True then page by
+            # -published_at; a partial index keeps that scan tight and
+            # skips inactive rows entirely
+            models.Index(
+                fields=["-published_at"],
+                condition=models.Q(is_active=True),
+                name="news_active_pub_idx",
+            ),
+            models.Index(fields=["category", "is_active"]),
         ]
 
     def __str__(self):
@@ -80,6 +96,9 @@ class UserReadArticle(models.Model):
 
     class Meta:
         unique_together = ("user", "article")
+        indexes = [
+            models.Index(fields=["user", "-read_at"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username} read {self.article.title[:50]}"
@@ -1,7 +1,24 @@
+from datetime import datetime
+
 from rest_framework import serializers
 from .models import NewsArticle, NewsSource, NewsCategory, UserReadArticle
 
 
+class FastDateTimeField(serializers.DateTimeField):
+    """DateTimeField that parses ISO-8601 input with the C-implemented
+    datetime.fromisoformat before falling back to DRF's format loop"""
+
+    def to_internal_value(self, value):
+        if isinstance(value, str):
+            try:
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+            else:
+                return self.enforce_timezone(parsed)
+        return super().to_internal_value(value)
+
+
 class NewsSourceSerializer(serializers.ModelSerializer):
     """Serializer for NewsSource model"""
 
@@ -22,7 +39,9 @@ class NewsCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
     def get_article_count(self, obj):
-        return obj.articles.filter(is_active=True).count()
+        # Served from the denormalized counter maintained at ingestion
+        # time — no join or COUNT per category
+        return obj.active_article_count
 
 
 class NewsArticleListSerializer(serializers.ModelSerializer):
@@ -51,6 +70,12 @@ class NewsArticleListSerializer(serializers.ModelSerializer):
 
     def get_has_analysis(self, obj):
         """Check if current user has analyzed this article"""
+        # Prefer the Exists annotation set by the article viewset; fall
+        # back to a query for instances serialized outside that path
+        flag = getattr(obj, "has_user_analysis", None)
+        if flag is not None:
+            return flag
+
         request = self.context.get("request")
         if request and request.user.is_authenticated:
             return obj.sentiment_analyses.filter(user=request.user).exists()
@@ -90,12 +115,19 @@ class NewsArticleDetailSerializer(serializers.ModelSerializer):
         if request and request.user.is_authenticated:
             from analysis.serializers import SentimentAnalysisSerializer
 
-            analyses = obj.sentiment_analyses.filter(user=request.user)
+            # Use the to_attr prefetch from the viewset when present
+            analyses = getattr(obj, "my_analyses", None)
+            if analyses is None:
+                analyses = obj.sentiment_analyses.filter(user=request.user)
             return SentimentAnalysisSerializer(analyses, many=True).data
         return []
 
     def get_is_read_by_user(self, obj):
         """Check if user has read this article"""
+        flag = getattr(obj, "user_has_read", None)
+        if flag is not None:
+            return flag
+
         request = self.context.get("request")
         if request and request.user.is_authenticated:
             return UserReadArticle.objects.filter(
@@ -123,11 +155,11 @@ class UserReadArticleSerializer(serializers.ModelSerializer):
 class NewsSearchSerializer(serializers.Serializer):
     """Serializer for news search parameters"""
 
-    query = serializers.CharField(max_length=200, required=False)
+    search = serializers.CharField(max_length=200, required=False)
     category = serializers.CharField(max_length=50, required=False)
     source = serializers.CharField(max_length=100, required=False)
-    from_date = serializers.DateTimeField(required=False)
-    to_date = serializers.DateTimeField(required=False)
+    from_date = FastDateTimeField(required=False)
+    to_date = FastDateTimeField(required=False)
     sort_by = serializers.ChoiceField(
         choices=[
             ("published_at", "Published Date"),
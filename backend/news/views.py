@@ -1,9 +1,19 @@
+import hashlib
+import threading
+import uuid
+
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.db.models import Q, Count, Exists, Max, OuterRef, Prefetch
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.utils.text import slugify
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_cookie
 from datetime import timedelta
 from .models import NewsArticle, NewsSource, NewsCategory, UserReadArticle
 from .serializers import (
@@ -14,27 +24,111 @@ from .serializers import (
     UserReadArticleSerializer,
     NewsSearchSerializer,
 )
-from .services import NewsAPIService, populate_sample_categories
+from .services import get_news_api_service, populate_sample_categories
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _article_list_etag(request, *args, **kwargs):
+    """ETag for polled article endpoints
+
+    Fingerprints the newest active published_at (cached for 10s so polls
+    don't each pay the aggregate) together with the query string and the
+    requesting user's identity plus their last_analysis_date — the same
+    stamp the stats cache keys on — so unchanged polls are answered with
+    an empty 304 before any serialization runs, while a new analysis
+    bumps the tag and refreshes the cached has_analysis flags.
+    """
+
+    def newest_published():
+        stamp = NewsArticle.objects.filter(is_active=True).aggregate(
+            m=Max("published_at")
+        )["m"]
+        return stamp.isoformat() if stamp else ""
+
+    stamp = cache.get_or_set("news:articles-max-published", newest_published, 10)
+
+    user_stamp = "0"
+    if request.user.is_authenticated:
+        profile = getattr(request.user, "profile", None)
+        analysis_stamp = (
+            profile.last_analysis_date.isoformat()
+            if profile and profile.last_analysis_date
+            else "0"
+        )
+        user_stamp = f"{request.user.pk}:{analysis_stamp}"
+
+    raw = f"{stamp}:{user_stamp}:{sorted(request.GET.items())}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def _prepare_article_list(queryset, user):
+    """Shape an article queryset for NewsArticleListSerializer
+
+    Joins the relations the serializer dereferences, restricts the SELECT
+    to the columns it renders and annotates the per-user analysis flag so
+    no row triggers follow-up queries.
+    """
+    queryset = queryset.select_related("source", "category").only(
+        "id",
+        "title",
+        "description",
+        "url",
+        "url_to_image",
+        "author",
+        "published_at",
+        "source__name",
+        "category__name",
+        "category__slug",
+    )
+
+    if user.is_authenticated:
+        from analysis.models import SentimentAnalysis
+
+        queryset = queryset.annotate(
+            has_user_analysis=Exists(
+                SentimentAnalysis.objects.filter(article=OuterRef("pk"), user=user)
+            )
+        )
+
+    return queryset
+
+
 class StandardResultsPagination(PageNumberPagination):
-    """Standard pagination for news articles"""
+    """Standard pagination for news articles
+
+    Pages are resolved over bare primary keys first, so deep OFFSET pages
+    scan and discard narrow id rows instead of fully-hydrated articles
+    with their joins and annotations; only the page's own rows are
+    fetched in full.
+    """
 
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
 
+    def paginate_queryset(self, queryset, request, view=None):
+        pks = super().paginate_queryset(
+            queryset.values_list("pk", flat=True), request, view
+        )
+        if pks is None:
+            return None
+
+        ordering = {pk: index for index, pk in enumerate(pks)}
+        rows = list(queryset.filter(pk__in=pks))
+        rows.sort(key=lambda row: ordering[row.pk])
+        return rows
+
 
 class NewsArticleViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for news articles"""
 
-    queryset = (
-        NewsArticle.objects.filter(is_active=True)
-        .select_related("source", "category")
-        .prefetch_related("sentiment_analyses")
+    # No blanket sentiment_analyses prefetch: list rows only need the
+    # Exists flag annotated below, and retrieve prefetches the requesting
+    # user's analyses specifically
+    queryset = NewsArticle.objects.filter(is_active=True).select_related(
+        "source", "category"
     )
     pagination_class = StandardResultsPagination
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -44,45 +138,104 @@ class NewsArticleViewSet(viewsets.ReadOnlyModelViewSet):
             return NewsArticleDetailSerializer
         return NewsArticleListSerializer
 
+    @method_decorator(condition(etag_func=_article_list_etag))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def get_queryset(self):
         """Filter articles based on query parameters"""
         queryset = self.queryset
 
-        # Filter by category
-        category = self.request.query_params.get("category")
-        if category:
-            queryset = queryset.filter(
-                Q(category__slug=category) | Q(category__name__icontains=category)
+        # List responses never render the content blob or timestamps;
+        # fetch only the columns the list serializer serializes
+        if self.action in ("list", "trending"):
+            queryset = queryset.only(
+                "id",
+                "title",
+                "description",
+                "url",
+                "url_to_image",
+                "author",
+                "published_at",
+                "source__name",
+                "category__name",
+                "category__slug",
             )
+        elif self.action != "retrieve":
+            # Only the detail serializer renders the body; keep the blob
+            # out of every other per-object fetch (e.g. mark_as_read)
+            queryset = queryset.defer("content")
+
+        # Annotate the per-user flags the serializers expose so list pages
+        # don't run one EXISTS query per row
+        user = self.request.user
+        if user.is_authenticated:
+            from analysis.models import SentimentAnalysis
+
+            queryset = queryset.annotate(
+                has_user_analysis=Exists(
+                    SentimentAnalysis.objects.filter(
+                        article=OuterRef("pk"), user=user
+                    )
+                ),
+                user_has_read=Exists(
+                    UserReadArticle.objects.filter(article=OuterRef("pk"), user=user)
+                ),
+            )
+
+            # The detail serializer renders the user's own analyses with
+            # their nested relations — prefetch exactly that set
+            if self.action == "retrieve":
+                queryset = queryset.prefetch_related(
+                    Prefetch(
+                        "sentiment_analyses",
+                        queryset=SentimentAnalysis.objects.filter(
+                            user=user
+                        ).select_related(
+                            "user", "article__source", "article__category"
+                        ),
+                        to_attr="my_analyses",
+                    )
+                )
+
+        # Validate all filter params in one place; invalid input becomes a
+        # 400 instead of leaking raw strings into the SQL layer
+        params_serializer = NewsSearchSerializer(data=self.request.query_params)
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+
+        # Filter by category — normalize to the unique slug so the lookup
+        # is a single indexed match, instead of the old OR'd name
+        # icontains branch that forced a scan over NewsCategory
+        category = params.get("category")
+        if category:
+            queryset = queryset.filter(category__slug=slugify(category))
 
         # Filter by source
-        source = self.request.query_params.get("source")
+        source = params.get("source")
         if source:
             queryset = queryset.filter(source__name__icontains=source)
 
-        # Search in title and description
-        search = self.request.query_params.get("search")
+        # Search in title and description. One- or two-character terms
+        # would scan every row for a near-useless match set, so short
+        # terms return an empty page instead (friendlier than a 400 for
+        # clients searching as the user types)
+        search = params.get("search", "").strip()
         if search:
+            if len(search) < 3:
+                return queryset.none()
             queryset = queryset.filter(
                 Q(title__icontains=search) | Q(description__icontains=search)
             )
 
-        # Filter by date range
-        from_date = self.request.query_params.get("from_date")
-        to_date = self.request.query_params.get("to_date")
+        # Filter by date range (already parsed to aware datetimes)
+        if params.get("from_date"):
+            queryset = queryset.filter(published_at__gte=params["from_date"])
+        if params.get("to_date"):
+            queryset = queryset.filter(published_at__lte=params["to_date"])
 
-        if from_date:
-            queryset = queryset.filter(published_at__gte=from_date)
-        if to_date:
-            queryset = queryset.filter(published_at__lte=to_date)
-
-        # Sort by parameter
-        sort_by = self.request.query_params.get("sort_by", "-published_at")
-        valid_sorts = ["published_at", "-published_at", "title", "-created_at"]
-        if sort_by in valid_sorts:
-            queryset = queryset.order_by(sort_by)
-
-        return queryset
+        # Sort by validated choice (defaults to -published_at)
+        return queryset.order_by(params["sort_by"])
 
     @action(
         detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated]
@@ -90,69 +243,178 @@ class NewsArticleViewSet(viewsets.ReadOnlyModelViewSet):
     def mark_as_read(self, request, pk=None):
         """Mark article as read by the user"""
         article = self.get_object()
-        user_read, created = UserReadArticle.objects.get_or_create(
-            user=request.user, article=article
+
+        # The article fetch already carries the user_has_read Exists
+        # annotation, so a single INSERT ... ON CONFLICT DO NOTHING (the
+        # unique (user, article) constraint backs ignore_conflicts)
+        # replaces get_or_create's SELECT-then-INSERT transaction
+        already_read = bool(getattr(article, "user_has_read", False))
+        UserReadArticle.objects.bulk_create(
+            [UserReadArticle(user=request.user, article=article)],
+            ignore_conflicts=True,
         )
 
-        if created:
-            return Response({"status": "marked as read"})
-        else:
+        if already_read:
             return Response({"status": "already read"})
+        return Response({"status": "marked as read"})
+
+    @action(
+        detail=False, methods=["post"], permission_classes=[permissions.IsAuthenticated]
+    )
+    def mark_many_as_read(self, request):
+        """Mark a batch of articles as read in one statement
+
+        Lets clients tracking scroll position flush a screenful of ids in
+        one round-trip instead of one mark_as_read call per article;
+        duplicates and already-read entries are dropped by the unique
+        constraint.
+        """
+        article_ids = request.data.get("article_ids")
+        if not isinstance(article_ids, list) or not article_ids:
+            return Response(
+                {"error": "article_ids must be a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            article_ids = [int(article_id) for article_id in article_ids]
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "article_ids must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        valid_ids = list(
+            NewsArticle.objects.filter(
+                pk__in=article_ids, is_active=True
+            ).values_list("pk", flat=True)
+        )
+        UserReadArticle.objects.bulk_create(
+            [
+                UserReadArticle(user=request.user, article_id=article_id)
+                for article_id in valid_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+        return Response({"status": "success", "marked_count": len(valid_ids)})
 
     @action(
         detail=False, methods=["post"], permission_classes=[permissions.IsAuthenticated]
     )
     def fetch_latest(self, request):
-        """Fetch latest articles from News API"""
+        """Kick off a background fetch of latest articles from News API
+
+        The outbound NewsAPI call plus bulk insert can take many seconds;
+        running it on a daemon thread (a worker-queue stand-in — the
+        project has no Celery broker) frees the request immediately.
+        Progress is tracked in the cache under the returned job_id and can
+        be polled via fetch_status.
+        """
         category = request.data.get("category")
         max_articles = min(int(request.data.get("max_articles", 50)), 100)
 
-        try:
-            service = NewsAPIService()
-            created_count = service.fetch_and_store_articles(
-                category=category, max_articles=max_articles
-            )
+        job_id = uuid.uuid4().hex
+        job_key = f"news:fetch-job:{job_id}"
+        cache.set(job_key, {"status": "pending"}, 3600)
+
+        def run_fetch():
+            try:
+                service = get_news_api_service()
+                created_count = service.fetch_and_store_articles(
+                    category=category, max_articles=max_articles
+                )
+                cache.set(
+                    job_key,
+                    {
+                        "status": "success",
+                        "created_count": created_count,
+                        "message": f"Fetched {created_count} new articles",
+                    },
+                    3600,
+                )
+            except Exception as e:
+                logger.error(f"Error fetching articles: {e}")
+                cache.set(job_key, {"status": "failed", "error": str(e)}, 3600)
 
+        threading.Thread(target=run_fetch, daemon=True).start()
+
+        return Response(
+            {
+                "status": "accepted",
+                "job_id": job_id,
+                "message": "Fetch started; poll fetch_status with this job_id",
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated]
+    )
+    def fetch_status(self, request):
+        """Report the state of a fetch_latest job"""
+        job_id = request.query_params.get("job_id")
+        if not job_id:
             return Response(
-                {
-                    "status": "success",
-                    "created_count": created_count,
-                    "message": f"Fetched {created_count} new articles",
-                }
+                {"error": "job_id is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        except Exception as e:
-            logger.error(f"Error fetching articles: {e}")
+        state = cache.get(f"news:fetch-job:{job_id}")
+        if state is None:
             return Response(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "Unknown or expired job_id"},
+                status=status.HTTP_404_NOT_FOUND,
             )
 
+        return Response(state)
+
     @action(detail=False, methods=["get"])
+    @method_decorator(condition(etag_func=_article_list_etag))
+    @method_decorator(cache_page(60))
+    @method_decorator(vary_on_cookie)
     def trending(self, request):
-        """Get trending articles (most analyzed in last 24 hours)"""
-        since = timezone.now() - timedelta(hours=24)
-
-        trending_articles = (
-            self.get_queryset()
-            .annotate(
-                analysis_count=Count(
-                    "sentiment_analyses",
-                    filter=Q(sentiment_analyses__created_at__gte=since),
+        """Get trending articles (most analyzed in last 24 hours)
+
+        Cached for a minute per session cookie, since the response carries
+        per-user has_analysis flags. The underlying ranking is the same
+        for everyone and changes slowly, so it is computed at most every
+        five minutes — a cache-backed stand-in for a materialized view —
+        and only the per-user hydration runs per request.
+        """
+
+        def compute_ranking():
+            # Aggregate the analysis table alone: the -created_at index
+            # narrows to the last 24h before grouping, instead of
+            # LEFT-JOINing every active article against its analyses and
+            # aggregating the full join
+            from analysis.models import SentimentAnalysis
+
+            since = timezone.now() - timedelta(hours=24)
+            counts = (
+                SentimentAnalysis.objects.filter(
+                    created_at__gte=since, article__is_active=True
                 )
+                .values("article")
+                .annotate(analysis_count=Count("pk"))
+                .order_by("-analysis_count")[:20]
             )
-            .filter(analysis_count__gt=0)
-            .order_by("-analysis_count", "-published_at")[:20]
-        )
+            return [row["article"] for row in counts]
+
+        ids = cache.get_or_set("news:trending-24h", compute_ranking, 300)
+
+        ordering = {pk: index for index, pk in enumerate(ids)}
+        trending_articles = list(self.get_queryset().filter(pk__in=ids))
+        trending_articles.sort(key=lambda article: ordering[article.pk])
 
         serializer = self.get_serializer(trending_articles, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
+    @method_decorator(cache_page(60))
     def categories_with_counts(self, request):
-        """Get categories with article counts"""
-        categories = NewsCategory.objects.annotate(
-            article_count=Count("articles", filter=Q(articles__is_active=True))
-        ).filter(article_count__gt=0)
+        """Get categories with article counts (same for every user, so
+        cached unconditionally for a minute)"""
+        categories = NewsCategory.objects.filter(active_article_count__gt=0)
 
         serializer = NewsCategorySerializer(categories, many=True)
         return Response(serializer.data)
@@ -161,9 +423,7 @@ class NewsArticleViewSet(viewsets.ReadOnlyModelViewSet):
 class NewsSourceViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for news sources"""
 
-    queryset = NewsSource.objects.annotate(
-        article_count=Count("articles", filter=Q(articles__is_active=True))
-    ).filter(article_count__gt=0)
+    queryset = NewsSource.objects.filter(active_article_count__gt=0)
     serializer_class = NewsSourceSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -171,9 +431,10 @@ class NewsSourceViewSet(viewsets.ReadOnlyModelViewSet):
     def articles(self, request, pk=None):
         """Get articles from a specific source"""
         source = self.get_object()
-        articles = NewsArticle.objects.filter(source=source, is_active=True).order_by(
-            "-published_at"
-        )
+        articles = _prepare_article_list(
+            NewsArticle.objects.filter(source=source, is_active=True),
+            request.user,
+        ).order_by("-published_at")
 
         page = self.paginate_queryset(articles)
         if page is not None:
@@ -191,9 +452,7 @@ class NewsSourceViewSet(viewsets.ReadOnlyModelViewSet):
 class NewsCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for news categories"""
 
-    queryset = NewsCategory.objects.annotate(
-        article_count=Count("articles", filter=Q(articles__is_active=True))
-    )
+    queryset = NewsCategory.objects.all()
     serializer_class = NewsCategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     lookup_field = "slug"
@@ -202,11 +461,10 @@ class NewsCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     def articles(self, request, slug=None):
         """Get articles from a specific category"""
         category = self.get_object()
-        articles = (
-            NewsArticle.objects.filter(category=category, is_active=True)
-            .select_related("source")
-            .order_by("-published_at")
-        )
+        articles = _prepare_article_list(
+            NewsArticle.objects.filter(category=category, is_active=True),
+            request.user,
+        ).order_by("-published_at")
 
         page = self.paginate_queryset(articles)
         if page is not None:
@@ -242,13 +500,22 @@ class UserReadArticleViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return UserReadArticle.objects.filter(user=self.request.user).select_related(
-            "article"
+        # The serializer renders only the article id and title, so keep
+        # the joined article row narrow — pulling full articles here
+        # drags the content blob into every history page
+        return (
+            UserReadArticle.objects.filter(user=self.request.user)
+            .select_related("article")
+            .only("id", "read_at", "article__id", "article__title")
+            .order_by("-read_at")
         )
 
     @action(detail=False, methods=["get"])
     def recent(self, request):
-        """Get recently read articles"""
+        """Get recently read articles
+
+        The (user, -read_at) index makes this top-20 a pure range scan.
+        """
         recent_reads = self.get_queryset().order_by("-read_at")[:20]
         serializer = self.get_serializer(recent_reads, many=True)
         return Response(serializer.data)
@@ -256,8 +523,8 @@ class UserReadArticleViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["delete"])
     def clear_history(self, request):
         """Clear user's read history"""
-        deleted_count = self.get_queryset().count()
-        self.get_queryset().delete()
+        # delete() already reports how many rows went away
+        deleted_count, _ = self.get_queryset().delete()
 
         return Response(
             {
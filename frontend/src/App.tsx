@@ -131,13 +131,32 @@ function AppContent() {
     setError(null)
 
     try {
+      // fetch_latest runs in the background and returns a job_id;
+      // poll fetch_status until the job resolves
       const response = await newsAPI.fetchLatest(undefined, 50)
-      
-      if (response.data.created_count > 0) {
-        // Reload the articles after fetching
-        await loadInitialData()
+      const jobId = response.data.job_id
+
+      let jobState = null
+      for (let attempt = 0; attempt < 30; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 2000))
+        const statusResponse = await newsAPI.getFetchStatus(jobId)
+        if (statusResponse.data.status !== 'pending') {
+          jobState = statusResponse.data
+          break
+        }
+      }
+
+      if (jobState?.status === 'success') {
+        if (jobState.created_count > 0) {
+          // Reload the articles after fetching
+          await loadInitialData()
+        } else {
+          setError('No new articles were fetched. The database might already be up to date.')
+        }
+      } else if (jobState?.status === 'failed') {
+        setError('Failed to fetch news. Please ensure you have a valid NEWS_API_KEY configured.')
       } else {
-        setError('No new articles were fetched. The database might already be up to date.')
+        setError('Fetching news is taking longer than expected. Please refresh in a moment.')
       }
     } catch (err) {
       setError('Failed to fetch news. Please ensure you have a valid NEWS_API_KEY configured.')
@@ -180,6 +180,11 @@ export const newsAPI = {
       category,
       max_articles: max_articles || 50
     }),
+
+  getFetchStatus: (jobId: string) =>
+    apiClient.get('/news/articles/fetch_status/', {
+      params: { job_id: jobId }
+    }),
 }
 
 // Analysis API